@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.database import create_db_and_tables
+from app.helpers.provisioning import create_hash_executor
 from app.middleware.configure import add_middlewares
 from app.routers import amendments
 from app.routers import auth
@@ -15,9 +16,11 @@ from app.routers import users
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await create_db_and_tables()
+    app.state.hash_executor = create_hash_executor()
     yield
+    app.state.hash_executor.shutdown()
 
 
 def create_app() -> FastAPI:
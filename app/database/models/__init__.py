@@ -1,4 +1,8 @@
 from .amendments import Amendment
+from .blobs import Blob
+from .blobs import BlobChunk
+from .blobs import BlobPart
+from .blobs import BlobSection
 from .documents import Document
 from .group_memberships import GroupMembership
 from .groups import Group
@@ -13,6 +17,10 @@ from .users import UserRead
 
 __all__ = [
     "Amendment",
+    "Blob",
+    "BlobChunk",
+    "BlobPart",
+    "BlobSection",
     "Document",
     "GroupMembership",
     "Group",
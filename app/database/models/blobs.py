@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlmodel import Field
+
+from .helpers import BaseSQLModel
+
+
+class BlobChunk(BaseSQLModel, table=True):
+    __tablename__ = "blob_chunk"
+
+    # Raw sha256 of the uncompressed bytes, so identical chunks are stored once
+    digest: bytes = Field(primary_key=True)
+    codec: str
+    size: int
+    data: bytes
+
+
+class Blob(BaseSQLModel, table=True):
+    __tablename__ = "blob"
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    digest: bytes = Field(index=True, unique=True)
+    size: int
+
+
+class BlobSection(BaseSQLModel, table=True):
+    __tablename__ = "blob_section"
+
+    blob_id: uuid.UUID = Field(foreign_key="blob.id", primary_key=True)
+    section: int = Field(primary_key=True)
+    offset: int
+    size: int
+
+
+class BlobPart(BaseSQLModel, table=True):
+    __tablename__ = "blob_part"
+
+    blob_id: uuid.UUID = Field(foreign_key="blob.id", primary_key=True)
+    position: int = Field(primary_key=True)
+    offset: int
+    size: int
+    chunk_digest: bytes = Field(foreign_key="blob_chunk.digest")
@@ -16,7 +16,7 @@ class Document(BaseSQLModel, table=True):
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     title: str
-    body: str
+    body_blob_id: uuid.UUID = Field(foreign_key="blob.id")
     project_id: uuid.UUID = Field(foreign_key="project.id")
 
     project: Project | None = Relationship(back_populates="documents")
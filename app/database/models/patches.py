@@ -13,7 +13,7 @@ class Patch(BaseSQLModel, table=True):
     __tablename__ = "patch"
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    content: str
+    content_blob_id: uuid.UUID = Field(foreign_key="blob.id")
     amendment_id: uuid.UUID = Field(foreign_key="amendment.id")
 
     amendment: Amendment | None = Relationship(back_populates="patches")
@@ -0,0 +1,225 @@
+import hashlib
+import re
+import uuid
+import zlib
+from typing import Any
+from typing import cast
+from typing import NamedTuple
+
+from sqlalchemy import bindparam
+from sqlalchemy import CursorResult
+from sqlalchemy import literal
+from sqlalchemy import TableClause
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.sql.dml import Insert
+from sqlmodel import col
+from sqlmodel import insert
+from sqlmodel import select
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database.models import Blob
+from app.database.models import BlobChunk
+from app.database.models import BlobPart
+from app.database.models import BlobSection
+
+CHUNK_SIZE = 64 * 1024
+COMPRESSION_LEVEL = 6
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+QUERY_BATCH_SIZE = 500
+# A blank line ends a section; the separator stays with the section before it
+SECTION_BREAK = re.compile(rb"\n[ \t]*\n")
+
+CODEC_RAW = "raw"
+CODEC_ZLIB = "zlib"
+
+
+class PreparedBlob(NamedTuple):
+    digest: bytes
+    size: int
+    chunks: list[dict[str, Any]]
+    sections: list[dict[str, Any]]
+    parts: list[dict[str, Any]]
+
+
+def digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def compress(data: bytes) -> tuple[str, bytes]:
+    compressed = zlib.compress(data, COMPRESSION_LEVEL)
+    if len(compressed) >= len(data):
+        return CODEC_RAW, data
+    return CODEC_ZLIB, compressed
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    match codec:
+        case "raw":
+            return data
+        case "zlib":
+            return zlib.decompress(data)
+    raise ValueError(f"Unknown blob codec: {codec}")
+
+
+def split_sections(data: bytes) -> list[tuple[int, int]]:
+    """Return ``(offset, size)`` for each blank-line separated section of ``data``."""
+    boundaries = [match.end() for match in SECTION_BREAK.finditer(data)]
+    if not boundaries or boundaries[-1] != len(data):
+        boundaries.append(len(data))
+    starts = [0, *boundaries[:-1]]
+    return [(start, end - start) for start, end in zip(starts, boundaries) if end > start]
+
+
+def pack_chunks(sections: list[tuple[int, int]], chunk_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Group consecutive sections into ``(offset, size)`` chunks of at most ``chunk_size`` bytes.
+
+    Chunks end on a section boundary unless a single section is larger than ``chunk_size``.
+    """
+    chunks = []
+    start = end = 0
+    for offset, size in sections:
+        end = offset + size
+        if end - start > chunk_size and offset > start:
+            chunks.append((start, offset - start))
+            start = offset
+        while end - start > chunk_size:
+            chunks.append((start, chunk_size))
+            start += chunk_size
+    if end > start:
+        chunks.append((start, end - start))
+    return chunks
+
+
+def prepare_blob(text: str, chunk_size: int = CHUNK_SIZE) -> PreparedBlob:
+    """Split, compress and hash ``text`` into the rows that describe it, without the blob id."""
+    data = text.encode()
+    sections = split_sections(data)
+    chunks: dict[bytes, dict[str, Any]] = {}
+    parts = []
+    for position, (offset, size) in enumerate(pack_chunks(sections, chunk_size)):
+        raw = data[offset : offset + size]
+        chunk_digest = digest(raw)
+        if chunk_digest not in chunks:
+            codec, stored = compress(raw)
+            chunks[chunk_digest] = {"digest": chunk_digest, "codec": codec, "size": size, "data": stored}
+        parts.append({"position": position, "offset": offset, "size": size, "chunk_digest": chunk_digest})
+    return PreparedBlob(
+        digest=digest(data),
+        size=len(data),
+        chunks=list(chunks.values()),
+        sections=[
+            {"section": section, "offset": offset, "size": size} for section, (offset, size) in enumerate(sections)
+        ],
+        parts=parts,
+    )
+
+
+def insert_ignore(dialect_name: str, table: TableClause, *keys: str) -> Insert:
+    """Build an insert for ``table`` that skips rows whose ``keys`` already exist.
+
+    PostgreSQL and SQLite use ``ON CONFLICT DO NOTHING``. Other backends get a portable
+    ``INSERT ... SELECT ... WHERE NOT EXISTS``, which does not guard against concurrent writers.
+    Parameters are passed at execution time, one mapping per row.
+    """
+    match dialect_name:
+        case "postgresql":
+            return postgresql.insert(table).on_conflict_do_nothing()
+        case "sqlite":
+            return sqlite.insert(table).on_conflict_do_nothing()
+    params = {column.name: bindparam(column.name, type_=column.type) for column in table.columns}
+    duplicate = select(literal(1)).select_from(table).where(*(table.c[key] == params[key] for key in keys))
+    return insert(table).from_select(list(params), select(*params.values()).where(~duplicate.exists()))
+
+
+async def store_text(session: AsyncSession, text: str) -> Blob:
+    """Store ``text`` as a blob, reusing any existing blob or chunks with the same content.
+
+    Rows are written in the session's transaction; the caller is responsible for committing.
+    """
+    prepared = prepare_blob(text)
+    existing = await session.exec(select(Blob).where(Blob.digest == prepared.digest))
+    blob = existing.first()
+    if blob:
+        return blob
+
+    dialect_name = session.get_bind().dialect.name
+    tables = SQLModel.metadata.tables
+    if prepared.chunks:
+        await session.execute(insert_ignore(dialect_name, tables["blob_chunk"], "digest"), prepared.chunks)
+
+    blob = Blob(digest=prepared.digest, size=prepared.size)
+    result = await session.execute(
+        insert_ignore(dialect_name, tables["blob"], "digest"), {"id": blob.id, "digest": blob.digest, "size": blob.size}
+    )
+    if not cast(CursorResult[Any], result).rowcount:
+        # A concurrent writer stored the same text first
+        existing = await session.exec(select(Blob).where(Blob.digest == prepared.digest))
+        return existing.one()
+
+    if prepared.sections:
+        await session.execute(
+            insert(tables["blob_section"]), [{**row, "blob_id": blob.id} for row in prepared.sections]
+        )
+        await session.execute(insert(tables["blob_part"]), [{**row, "blob_id": blob.id} for row in prepared.parts])
+    return blob
+
+
+async def list_sections(session: AsyncSession, blob_id: uuid.UUID) -> list[BlobSection]:
+    result = await session.exec(
+        select(BlobSection).where(BlobSection.blob_id == blob_id).order_by(col(BlobSection.section))
+    )
+    return list(result.all())
+
+
+async def read_texts(session: AsyncSession, blob_ids: list[uuid.UUID]) -> dict[uuid.UUID, str]:
+    parts: dict[uuid.UUID, list[bytes]] = {blob_id: [] for blob_id in blob_ids}
+    ids = list(parts)
+    for index in range(0, len(ids), QUERY_BATCH_SIZE):
+        batch = ids[index : index + QUERY_BATCH_SIZE]
+        result = await session.exec(
+            select(BlobPart.blob_id, BlobChunk.codec, BlobChunk.data)
+            .join(BlobChunk, col(BlobChunk.digest) == col(BlobPart.chunk_digest))
+            .where(col(BlobPart.blob_id).in_(batch))
+            .order_by(col(BlobPart.blob_id), col(BlobPart.position))
+        )
+        for blob_id, codec, data in result.all():
+            parts[blob_id].append(decompress(codec, data))
+    return {blob_id: b"".join(chunks).decode() for blob_id, chunks in parts.items()}
+
+
+async def read_text(session: AsyncSession, blob_id: uuid.UUID) -> str:
+    texts = await read_texts(session, [blob_id])
+    return texts[blob_id]
+
+
+async def read_range(session: AsyncSession, blob_id: uuid.UUID, start: int, end: int) -> bytes:
+    """Return bytes ``[start, end)`` of the blob, decompressing only the chunks that overlap it."""
+    result = await session.exec(
+        select(BlobPart.offset, BlobChunk.codec, BlobChunk.data)
+        .join(BlobChunk, col(BlobChunk.digest) == col(BlobPart.chunk_digest))
+        .where(
+            BlobPart.blob_id == blob_id,
+            col(BlobPart.offset) < end,
+            col(BlobPart.offset) + col(BlobPart.size) > start,
+        )
+        .order_by(col(BlobPart.position))
+    )
+    parts = []
+    for offset, codec, data in result.all():
+        chunk = decompress(codec, data)
+        parts.append(chunk[max(start - offset, 0) : end - offset])
+    return b"".join(parts)
+
+
+async def read_section(session: AsyncSession, blob_id: uuid.UUID, section: int) -> str | None:
+    """Return a single section, decompressing only the chunks that cover its offsets."""
+    result = await session.exec(
+        select(BlobSection).where(BlobSection.blob_id == blob_id, BlobSection.section == section)
+    )
+    found = result.first()
+    if not found:
+        return None
+    data = await read_range(session, blob_id, found.offset, found.offset + found.size)
+    return data.decode()
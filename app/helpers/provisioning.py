@@ -0,0 +1,245 @@
+import asyncio
+import codecs
+import csv
+import enum
+import json
+import multiprocessing
+import uuid
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from pydantic import field_validator
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col
+from sqlmodel import Field
+from sqlmodel import or_
+from sqlmodel import select
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database.models import Document
+from app.database.models import Group
+from app.database.models import GroupMembership
+from app.database.models import Project
+from app.database.models import User
+from app.database.models import UserPasswordHash
+from app.security import hash_password
+from app.settings import get_settings
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+QUERY_BATCH_SIZE = 500
+
+
+class ProvisionFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class UserProvision(SQLModel):
+    username: str
+    email: str
+    password: str
+    group_ids: list[uuid.UUID] = Field(default_factory=list)
+
+    @field_validator("group_ids")
+    @classmethod
+    def unique_group_ids(cls, value: list[uuid.UUID]) -> list[uuid.UUID]:
+        return list(dict.fromkeys(value))
+
+
+class ProvisionResult(SQLModel):
+    line: int
+    username: str | None = None
+    id: uuid.UUID | None = None
+    error: str | None = None
+
+
+class ProvisionReport(SQLModel):
+    created: int = 0
+    failed: int = 0
+    errors: list[ProvisionResult] = Field(default_factory=list)
+
+
+def create_hash_executor() -> ProcessPoolExecutor:
+    # Spawned rather than forked workers, as the server process is multi-threaded
+    return ProcessPoolExecutor(
+        max_workers=get_settings().provision_hash_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+async def read_lines(stream: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    pending = b""
+    async for chunk in stream:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+    if pending:
+        yield pending.rstrip(b"\r")
+
+
+def parse_row(fmt: ProvisionFormat, line: str, header: list[str]) -> dict[str, Any]:
+    if fmt is ProvisionFormat.NDJSON:
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError("Expected a JSON object")
+        return row
+    values = next(csv.reader([line]))
+    if len(values) > len(header):
+        raise ValueError("Too many columns")
+    row = dict(zip(header, values))
+    row["group_ids"] = [group_id for group_id in row.get("group_ids", "").split(";") if group_id]
+    return row
+
+
+async def iter_batches(
+    lines: AsyncIterable[bytes], fmt: ProvisionFormat, batch_size: int
+) -> AsyncIterator[list[tuple[int, UserProvision | str]]]:
+    """Yield batches of ``(line, row)`` pairs, where ``row`` is an error message if the line did not parse."""
+    header: list[str] | None = None if fmt is ProvisionFormat.CSV else []
+    batch: list[tuple[int, UserProvision | str]] = []
+    line_number = 0
+    async for raw in lines:
+        line_number += 1
+        if line_number == 1:
+            raw = raw.removeprefix(codecs.BOM_UTF8)
+        if not raw.strip():
+            continue
+        if header is None:
+            header = [name.strip() for name in next(csv.reader([raw.decode(errors="replace")]))]
+            continue
+        try:
+            line = raw.decode()
+            batch.append((line_number, UserProvision.model_validate(parse_row(fmt, line, header))))
+        except ValidationError as exc:
+            messages = [f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in exc.errors()]
+            batch.append((line_number, "; ".join(messages)))
+        except UnicodeDecodeError:
+            batch.append((line_number, "Line is not valid UTF-8"))
+        except ValueError as exc:
+            batch.append((line_number, str(exc)))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _existing(session: AsyncSession, column: Any, values: set[Any], *criteria: Any) -> set[Any]:
+    found: set[Any] = set()
+    candidates = list(values)
+    for index in range(0, len(candidates), QUERY_BATCH_SIZE):
+        batch = candidates[index : index + QUERY_BATCH_SIZE]
+        result = await session.exec(select(column).where(col(column).in_(batch), *criteria))
+        found.update(result.all())
+    return found
+
+
+def _in_tenant(tenant_id: uuid.UUID) -> Any:
+    """Match groups scoped to the tenant itself or to one of its projects or documents."""
+    projects = select(Project.id).where(Project.tenant_id == tenant_id)
+    documents = select(Document.id).where(col(Document.project_id).in_(projects))
+    return or_(
+        col(Group.tenant_id) == tenant_id, col(Group.project_id).in_(projects), col(Group.document_id).in_(documents)
+    )
+
+
+def _build_rows(row: UserProvision, hashed: str) -> tuple[User, list[SQLModel]]:
+    user = User(username=row.username, email=row.email, hashed_password=hashed)
+    related: list[SQLModel] = [UserPasswordHash(user_id=user.id, hashed_password=hashed)]
+    related.extend(GroupMembership(user_id=user.id, group_id=group_id) for group_id in row.group_ids)
+    return user, related
+
+
+async def provision_batch(
+    session: AsyncSession,
+    batch: list[tuple[int, UserProvision | str]],
+    executor: ProcessPoolExecutor,
+    tenant_id: uuid.UUID | None = None,
+) -> list[ProvisionResult]:
+    """Validate, hash and insert one batch of users in a single transaction.
+
+    When ``tenant_id`` is given, memberships may only reference groups within that tenant.
+    """
+    results: list[ProvisionResult] = []
+    rows: list[tuple[int, UserProvision]] = []
+    for line, row in batch:
+        if isinstance(row, str):
+            results.append(ProvisionResult(line=line, error=row))
+        else:
+            rows.append((line, row))
+
+    usernames = await _existing(session, User.username, {row.username for _, row in rows})
+    emails = await _existing(session, User.email, {row.email for _, row in rows})
+    group_criteria = [_in_tenant(tenant_id)] if tenant_id else []
+    requested_groups = {group_id for _, row in rows for group_id in row.group_ids}
+    group_ids = await _existing(session, Group.id, requested_groups, *group_criteria)
+
+    accepted: list[tuple[int, UserProvision]] = []
+    for line, row in rows:
+        error = None
+        if row.username in usernames:
+            error = "Username already exists"
+        elif row.email in emails:
+            error = "Email already exists"
+        elif missing := [str(group_id) for group_id in row.group_ids if group_id not in group_ids]:
+            error = f"Group not found: {', '.join(missing)}"
+        if error:
+            results.append(ProvisionResult(line=line, username=row.username, error=error))
+            continue
+        # Later duplicates within the input are reported against the first occurrence
+        usernames.add(row.username)
+        emails.add(row.email)
+        accepted.append((line, row))
+
+    loop = asyncio.get_running_loop()
+    hashes = await asyncio.gather(*(loop.run_in_executor(executor, hash_password, row.password) for _, row in accepted))
+
+    built = [_build_rows(row, hashed) for (_, row), hashed in zip(accepted, hashes)]
+    try:
+        session.add_all([user for user, _ in built])
+        await session.flush()
+        session.add_all([item for _, related in built for item in related])
+        await session.commit()
+    except IntegrityError:
+        # A concurrent writer won a race; retry row by row to find the offenders
+        await session.rollback()
+        built = [_build_rows(row, hashed) for (_, row), hashed in zip(accepted, hashes)]
+        for (line, row), (user, related) in zip(accepted, built):
+            try:
+                session.add(user)
+                await session.flush()
+                session.add_all(related)
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                results.append(ProvisionResult(line=line, username=row.username, error="Conflicts with existing data"))
+            else:
+                results.append(ProvisionResult(line=line, username=row.username, id=user.id))
+    else:
+        results.extend(
+            ProvisionResult(line=line, username=row.username, id=user.id)
+            for (line, row), (user, _) in zip(accepted, built)
+        )
+
+    return sorted(results, key=lambda result: result.line)
+
+
+async def provision_users(
+    session: AsyncSession,
+    stream: AsyncIterable[bytes],
+    fmt: ProvisionFormat,
+    executor: ProcessPoolExecutor,
+    batch_size: int | None = None,
+    tenant_id: uuid.UUID | None = None,
+) -> AsyncIterator[ProvisionResult]:
+    batch_size = batch_size or get_settings().provision_batch_size
+    async for batch in iter_batches(read_lines(stream), fmt, batch_size):
+        results = await provision_batch(session, batch, executor, tenant_id)
+        # Committed rows are not needed again; keep the identity map from growing with the import
+        session.expunge_all()
+        for result in results:
+            yield result
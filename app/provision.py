@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+import sys
+import uuid
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from app.database import async_session
+from app.database import create_db_and_tables
+from app.helpers.provisioning import create_hash_executor
+from app.helpers.provisioning import provision_users
+from app.helpers.provisioning import ProvisionFormat
+
+READ_SIZE = 64 * 1024
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as handle:
+        while chunk := handle.read(READ_SIZE):
+            yield chunk
+
+
+async def run(path: Path, fmt: ProvisionFormat, batch_size: int | None, tenant_id: uuid.UUID | None) -> int:
+    await create_db_and_tables()
+    created = failed = 0
+    with create_hash_executor() as executor:
+        async with async_session() as session:
+            async for result in provision_users(session, read_file(path), fmt, executor, batch_size, tenant_id):
+                if result.error:
+                    failed += 1
+                    print(result.model_dump_json(), file=sys.stderr)
+                else:
+                    created += 1
+    print(f"created={created} failed={failed}")
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-provision users and group memberships from CSV or NDJSON.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", dest="fmt", type=ProvisionFormat, choices=list(ProvisionFormat))
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--tenant-id", type=uuid.UUID, default=None, help="Only allow groups within this tenant")
+    args = parser.parse_args()
+    fmt = args.fmt or (ProvisionFormat.NDJSON if args.path.suffix in {".ndjson", ".jsonl"} else ProvisionFormat.CSV)
+    sys.exit(asyncio.run(run(args.path, fmt, args.batch_size, args.tenant_id)))
+
+
+if __name__ == "__main__":
+    main()
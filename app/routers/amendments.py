@@ -11,6 +11,8 @@ from app.database import get_session
 from app.database.models import Amendment
 from app.database.models import Document
 from app.database.models import Patch
+from app.helpers.blobs import read_texts
+from app.helpers.blobs import store_text
 
 router = APIRouter(prefix="/api/v1/amendment", tags=["amendment"])
 
@@ -21,6 +23,12 @@ class AmendmentCreate(SQLModel):
     patch_content: str
 
 
+class PatchRead(SQLModel):
+    id: uuid.UUID
+    content: str
+    amendment_id: uuid.UUID
+
+
 @router.get("/{amendment_id}", response_model=Amendment)
 async def get_amendment(amendment_id: uuid.UUID, session: AsyncSession = Depends(get_session)) -> Amendment:
     result = await session.exec(select(Amendment).where(Amendment.id == amendment_id))
@@ -43,17 +51,23 @@ async def create_amendment(
     session.add(amendment)
     await session.commit()
     await session.refresh(amendment)
-    patch = Patch(content=payload.patch_content, amendment_id=amendment.id)
+    blob = await store_text(session, payload.patch_content)
+    patch = Patch(content_blob_id=blob.id, amendment_id=amendment.id)
     session.add(patch)
     await session.commit()
     return amendment
 
 
-@router.get("/{document_id}/patches", response_model=list[Patch])
-async def list_patches(document_id: uuid.UUID, session: AsyncSession = Depends(get_session)) -> list[Patch]:
+@router.get("/{document_id}/patches", response_model=list[PatchRead])
+async def list_patches(document_id: uuid.UUID, session: AsyncSession = Depends(get_session)) -> list[PatchRead]:
     amendment_ids = await session.exec(select(Amendment.id).where(Amendment.document_id == document_id))
     ids = amendment_ids.all()
     if not ids:
         return []
     patches = await session.exec(select(Patch).where(Patch.amendment_id.in_(ids)))  # type: ignore[attr-defined]
-    return patches.all()
+    rows = patches.all()
+    contents = await read_texts(session, [patch.content_blob_id for patch in rows])
+    return [
+        PatchRead(id=patch.id, content=contents[patch.content_blob_id], amendment_id=patch.amendment_id)
+        for patch in rows
+    ]
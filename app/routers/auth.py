@@ -1,5 +1,7 @@
+import uuid
 from datetime import timedelta
 
+import jwt
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
@@ -14,6 +16,7 @@ from app.database.models import User
 from app.database.models import UserCreate
 from app.database.models import UserPasswordHash
 from app.security import create_access_token
+from app.security import decode_token
 from app.security import hash_password
 from app.security import verify_password
 
@@ -21,6 +24,23 @@ router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
+async def get_current_user(token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_session)) -> User:
+    unauthorized = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        user_id = uuid.UUID(decode_token(token)["sub"])
+    except (jwt.PyJWTError, KeyError, ValueError):
+        raise unauthorized from None
+    result = await session.exec(select(User).where(User.id == user_id))
+    user = result.first()
+    if not user:
+        raise unauthorized
+    return user
+
+
 @router.post("/register", response_model=UserCreate)
 async def register_user(user: UserCreate, session: AsyncSession = Depends(get_session)) -> UserCreate:
     existing = await session.exec(select(User).where(User.username == user.username))
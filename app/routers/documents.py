@@ -3,6 +3,8 @@ import uuid
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Response
 from sqlmodel import select
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -10,6 +12,11 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.database import get_session
 from app.database.models import Document
 from app.database.models import Project
+from app.helpers.blobs import list_sections
+from app.helpers.blobs import read_range
+from app.helpers.blobs import read_section
+from app.helpers.blobs import read_text
+from app.helpers.blobs import store_text
 
 router = APIRouter(prefix="/api/v1/document", tags=["document"])
 
@@ -20,29 +27,93 @@ class DocumentCreate(SQLModel):
     project_id: uuid.UUID
 
 
-@router.get("", response_model=list[Document])
-async def list_documents(session: AsyncSession = Depends(get_session)) -> list[Document]:
+class DocumentSummary(SQLModel):
+    id: uuid.UUID
+    title: str
+    project_id: uuid.UUID
+
+
+class DocumentRead(DocumentSummary):
+    body: str
+
+
+class DocumentSectionRead(SQLModel):
+    section: int
+    offset: int
+    size: int
+
+
+async def _get_document(document_id: uuid.UUID, session: AsyncSession) -> Document:
+    result = await session.exec(select(Document).where(Document.id == document_id))
+    document = result.first()
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return document
+
+
+@router.get("", response_model=list[DocumentSummary])
+async def list_documents(session: AsyncSession = Depends(get_session)) -> list[DocumentSummary]:
     result = await session.exec(select(Document))
-    return result.all()
+    return [
+        DocumentSummary(id=document.id, title=document.title, project_id=document.project_id)
+        for document in result.all()
+    ]
 
 
-@router.post("", response_model=Document)
-async def create_document(payload: DocumentCreate, session: AsyncSession = Depends(get_session)) -> Document:
+@router.post("", response_model=DocumentRead)
+async def create_document(payload: DocumentCreate, session: AsyncSession = Depends(get_session)) -> DocumentRead:
     project_result = await session.exec(select(Project).where(Project.id == payload.project_id))
     if not project_result.first():
         raise HTTPException(status_code=404, detail="Project not found")
 
-    document = Document(title=payload.title, body=payload.body, project_id=payload.project_id)
+    blob = await store_text(session, payload.body)
+    document = Document(title=payload.title, body_blob_id=blob.id, project_id=payload.project_id)
     session.add(document)
     await session.commit()
     await session.refresh(document)
-    return document
+    return DocumentRead(id=document.id, title=document.title, project_id=document.project_id, body=payload.body)
 
 
-@router.get("/{document_id}", response_model=Document)
-async def get_document(document_id: uuid.UUID, session: AsyncSession = Depends(get_session)) -> Document:
-    result = await session.exec(select(Document).where(Document.id == document_id))
-    document = result.first()
-    if not document:
-        raise HTTPException(status_code=404, detail="Document not found")
-    return document
+@router.get("/{document_id}", response_model=DocumentRead)
+async def get_document(document_id: uuid.UUID, session: AsyncSession = Depends(get_session)) -> DocumentRead:
+    document = await _get_document(document_id, session)
+    body = await read_text(session, document.body_blob_id)
+    return DocumentRead(id=document.id, title=document.title, project_id=document.project_id, body=body)
+
+
+@router.get("/{document_id}/sections", response_model=list[DocumentSectionRead])
+async def list_document_sections(
+    document_id: uuid.UUID, session: AsyncSession = Depends(get_session)
+) -> list[DocumentSectionRead]:
+    document = await _get_document(document_id, session)
+    sections = await list_sections(session, document.body_blob_id)
+    return [DocumentSectionRead(section=row.section, offset=row.offset, size=row.size) for row in sections]
+
+
+@router.get("/{document_id}/sections/{section}")
+async def get_document_section(
+    document_id: uuid.UUID, section: int, session: AsyncSession = Depends(get_session)
+) -> Response:
+    document = await _get_document(document_id, session)
+    text = await read_section(session, document.body_blob_id, section)
+    if text is None:
+        raise HTTPException(status_code=404, detail="Section not found")
+    return Response(content=text, media_type="text/plain; charset=utf-8")
+
+
+@router.get("/{document_id}/range")
+async def get_document_range(
+    document_id: uuid.UUID,
+    start: int = Query(ge=0),
+    end: int = Query(gt=0),
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    """Return bytes ``[start, end)`` of the document body.
+
+    Offsets are UTF-8 byte offsets, so a range may begin or end partway through a character.
+    """
+    if end <= start:
+        raise HTTPException(status_code=400, detail="Range end must be greater than start")
+    document = await _get_document(document_id, session)
+    content = await read_range(session, document.body_blob_id, start, end)
+    return Response(content=content, media_type="application/octet-stream")
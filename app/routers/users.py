@@ -1,11 +1,23 @@
+import uuid
+
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Request
+from fastapi import status
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.database import get_session
+from app.database.models import Group
+from app.database.models import GroupMembership
 from app.database.models import User
 from app.database.models import UserRead
+from app.helpers.provisioning import provision_users
+from app.helpers.provisioning import ProvisionFormat
+from app.helpers.provisioning import ProvisionReport
+from app.routers.auth import get_current_user
 
 router = APIRouter(prefix="/api/v1/user", tags=["user"])
 
@@ -15,3 +27,33 @@ async def list_users(session: AsyncSession = Depends(get_session)) -> list[UserR
     result = await session.exec(select(User))
     users = result.all()
     return [UserRead(id=user.id, username=user.username, email=user.email) for user in users]
+
+
+@router.post("/bulk", response_model=ProvisionReport)
+async def bulk_provision_users(
+    request: Request,
+    tenant_id: uuid.UUID,
+    fmt: ProvisionFormat = Query(default=ProvisionFormat.CSV, alias="format"),
+    batch_size: int | None = Query(default=None, gt=0),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> ProvisionReport:
+    """Provision users for a tenant; only its moderators may do so, and only into its groups."""
+    moderator = await session.exec(
+        select(GroupMembership.id)
+        .join(Group)
+        .where(GroupMembership.user_id == current_user.id, Group.tenant_id == tenant_id, Group.name == "moderators")
+    )
+    if not moderator.first():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant moderator rights required")
+
+    report = ProvisionReport()
+    async for result in provision_users(
+        session, request.stream(), fmt, request.app.state.hash_executor, batch_size, tenant_id
+    ):
+        if result.error:
+            report.failed += 1
+            report.errors.append(result)
+        else:
+            report.created += 1
+    return report
@@ -9,6 +9,8 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24
     cors_allow_origins: list[str] = ["*"]
+    provision_batch_size: int = 1000
+    provision_hash_workers: int | None = None
 
 
 @lru_cache
@@ -0,0 +1,103 @@
+# Baseline schema
+#
+# Revision ID: 0001
+# Revises:
+# Create Date: 2026-10-19
+#
+# Databases created by ``create_all`` before migrations existed already have these tables, so each one is only
+# created when missing.
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _create_table(name: str, *columns: sa.Column) -> bool:
+    if sa.inspect(op.get_bind()).has_table(name):
+        return False
+    op.create_table(name, *columns)
+    return True
+
+
+def upgrade() -> None:
+    _create_table(
+        "tenant",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+    )
+    _create_table(
+        "project",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), sa.ForeignKey("tenant.id"), nullable=False),
+    )
+    _create_table(
+        "document",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("body", sa.String(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), sa.ForeignKey("project.id"), nullable=False),
+    )
+    _create_table(
+        "amendment",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("summary", sa.String(), nullable=False),
+        sa.Column("document_id", sa.Uuid(), sa.ForeignKey("document.id"), nullable=False),
+        sa.Column("approved", sa.Boolean(), nullable=False),
+    )
+    _create_table(
+        "patch",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.Column("amendment_id", sa.Uuid(), sa.ForeignKey("amendment.id"), nullable=False),
+    )
+    _create_table(
+        "groups",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("permissions", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), sa.ForeignKey("tenant.id"), nullable=True),
+        sa.Column("project_id", sa.Uuid(), sa.ForeignKey("project.id"), nullable=True),
+        sa.Column("document_id", sa.Uuid(), sa.ForeignKey("document.id"), nullable=True),
+    )
+    if _create_table(
+        "user",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+    ):
+        op.create_index("ix_user_username", "user", ["username"], unique=True)
+        op.create_index("ix_user_email", "user", ["email"], unique=True)
+    _create_table(
+        "group_membership",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("group_id", sa.Uuid(), sa.ForeignKey("groups.id"), nullable=False),
+    )
+    _create_table(
+        "user_password_hash",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    for name in (
+        "user_password_hash",
+        "group_membership",
+        "user",
+        "groups",
+        "patch",
+        "amendment",
+        "document",
+        "project",
+        "tenant",
+    ):
+        op.drop_table(name)
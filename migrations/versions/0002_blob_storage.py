@@ -0,0 +1,185 @@
+# Move document bodies and patch contents into blob storage
+#
+# Revision ID: 0002
+# Revises: 0001
+# Create Date: 2026-10-19
+#
+# The server's ``create_all`` may already have created the blob tables and new columns, so both are only added
+# when missing. Text is converted with the same helpers ``store_text`` uses; the migration runs on a synchronous
+# connection, so it performs the inserts itself.
+import uuid
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.helpers.blobs import decompress
+from app.helpers.blobs import insert_ignore
+from app.helpers.blobs import prepare_blob
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PAGE_SIZE = 500
+
+blob_chunk = sa.table(
+    "blob_chunk",
+    sa.column("digest", sa.LargeBinary()),
+    sa.column("codec", sa.String()),
+    sa.column("size", sa.Integer()),
+    sa.column("data", sa.LargeBinary()),
+)
+blob = sa.table(
+    "blob",
+    sa.column("id", sa.Uuid()),
+    sa.column("digest", sa.LargeBinary()),
+    sa.column("size", sa.Integer()),
+)
+blob_section = sa.table(
+    "blob_section",
+    sa.column("blob_id", sa.Uuid()),
+    sa.column("section", sa.Integer()),
+    sa.column("offset", sa.Integer()),
+    sa.column("size", sa.Integer()),
+)
+blob_part = sa.table(
+    "blob_part",
+    sa.column("blob_id", sa.Uuid()),
+    sa.column("position", sa.Integer()),
+    sa.column("offset", sa.Integer()),
+    sa.column("size", sa.Integer()),
+    sa.column("chunk_digest", sa.LargeBinary()),
+)
+
+
+def _create_table(name: str, *columns: sa.Column) -> None:
+    if not sa.inspect(op.get_bind()).has_table(name):
+        op.create_table(name, *columns)
+
+
+def _columns(table_name: str) -> set[str]:
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def _store_text(connection: sa.Connection, text: str) -> uuid.UUID:
+    prepared = prepare_blob(text)
+    existing = connection.execute(sa.select(blob.c.id).where(blob.c.digest == prepared.digest)).scalar()
+    if existing:
+        return existing
+
+    blob_id = uuid.uuid4()
+    if prepared.chunks:
+        connection.execute(insert_ignore(connection.dialect.name, blob_chunk, "digest"), prepared.chunks)
+    connection.execute(blob.insert().values(id=blob_id, digest=prepared.digest, size=prepared.size))
+    if prepared.sections:
+        connection.execute(blob_section.insert(), [{**row, "blob_id": blob_id} for row in prepared.sections])
+        connection.execute(blob_part.insert(), [{**row, "blob_id": blob_id} for row in prepared.parts])
+    return blob_id
+
+
+def _read_text(connection: sa.Connection, blob_id: uuid.UUID) -> str:
+    rows = connection.execute(
+        sa.select(blob_chunk.c.codec, blob_chunk.c.data)
+        .join(blob_part, blob_part.c.chunk_digest == blob_chunk.c.digest)
+        .where(blob_part.c.blob_id == blob_id)
+        .order_by(blob_part.c.position)
+    )
+    return b"".join(decompress(codec, data) for codec, data in rows).decode()
+
+
+def _rows(connection: sa.Connection, table: sa.TableClause, column: str) -> Iterator[sa.Row[Any]]:
+    """Page through ``(id, column)`` so large tables are not loaded in one go."""
+    last_id = None
+    while True:
+        query = sa.select(table.c.id, table.c[column]).order_by(table.c.id).limit(PAGE_SIZE)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        page = connection.execute(query).all()
+        if not page:
+            return
+        yield from page
+        last_id = page[-1][0]
+
+
+def _text_to_blob(table_name: str, text_column: str, blob_column: str) -> None:
+    if text_column not in _columns(table_name):
+        return
+    if blob_column not in _columns(table_name):
+        with op.batch_alter_table(table_name) as batch:
+            batch.add_column(sa.Column(blob_column, sa.Uuid(), nullable=True))
+
+    connection = op.get_bind()
+    table = sa.table(
+        table_name, sa.column("id", sa.Uuid()), sa.column(text_column, sa.String()), sa.column(blob_column, sa.Uuid())
+    )
+    for row_id, text in _rows(connection, table, text_column):
+        blob_id = _store_text(connection, text)
+        connection.execute(table.update().where(table.c.id == row_id).values({blob_column: blob_id}))
+
+    with op.batch_alter_table(table_name) as batch:
+        batch.alter_column(blob_column, existing_type=sa.Uuid(), nullable=False)
+        batch.create_foreign_key(f"fk_{table_name}_{blob_column}_blob", "blob", [blob_column], ["id"])
+        batch.drop_column(text_column)
+
+
+def _blob_to_text(table_name: str, text_column: str, blob_column: str) -> None:
+    with op.batch_alter_table(table_name) as batch:
+        batch.add_column(sa.Column(text_column, sa.String(), nullable=True))
+
+    connection = op.get_bind()
+    table = sa.table(
+        table_name, sa.column("id", sa.Uuid()), sa.column(text_column, sa.String()), sa.column(blob_column, sa.Uuid())
+    )
+    for row_id, blob_id in _rows(connection, table, blob_column):
+        text = _read_text(connection, blob_id)
+        connection.execute(table.update().where(table.c.id == row_id).values({text_column: text}))
+
+    with op.batch_alter_table(table_name) as batch:
+        batch.alter_column(text_column, existing_type=sa.String(), nullable=False)
+        batch.drop_column(blob_column)
+
+
+def upgrade() -> None:
+    _create_table(
+        "blob_chunk",
+        sa.Column("digest", sa.LargeBinary(), primary_key=True),
+        sa.Column("codec", sa.String(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+    )
+    if not sa.inspect(op.get_bind()).has_table("blob"):
+        op.create_table(
+            "blob",
+            sa.Column("id", sa.Uuid(), primary_key=True),
+            sa.Column("digest", sa.LargeBinary(), nullable=False),
+            sa.Column("size", sa.Integer(), nullable=False),
+        )
+        op.create_index("ix_blob_digest", "blob", ["digest"], unique=True)
+    _create_table(
+        "blob_section",
+        sa.Column("blob_id", sa.Uuid(), sa.ForeignKey("blob.id"), primary_key=True),
+        sa.Column("section", sa.Integer(), primary_key=True),
+        sa.Column("offset", sa.Integer(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+    )
+    _create_table(
+        "blob_part",
+        sa.Column("blob_id", sa.Uuid(), sa.ForeignKey("blob.id"), primary_key=True),
+        sa.Column("position", sa.Integer(), primary_key=True),
+        sa.Column("offset", sa.Integer(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("chunk_digest", sa.LargeBinary(), sa.ForeignKey("blob_chunk.digest"), nullable=False),
+    )
+    _text_to_blob("document", "body", "body_blob_id")
+    _text_to_blob("patch", "content", "content_blob_id")
+
+
+def downgrade() -> None:
+    _blob_to_text("document", "body", "body_blob_id")
+    _blob_to_text("patch", "content", "content_blob_id")
+    for name in ("blob_part", "blob_section", "blob", "blob_chunk"):
+        op.drop_table(name)